@@ -16,26 +16,42 @@
 r"""AtomDB, a database of atomic and ionic properties."""
 
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
+
+from functools import lru_cache
 
 from importlib import import_module
 
-from json import JSONEncoder, dumps
+from math import prod
+
+from mmap import mmap, ACCESS_READ
+
+from json import dumps
 
 from os import environ, makedirs
 
 from os.path import dirname, join
 
-from sys import platform
+from struct import Struct
 
-from msgpack import Packer, Unpacker
+from types import MappingProxyType
 
-from numpy import ndarray, frombuffer, exp, log
+from msgspec.msgpack import Decoder, Encoder, Ext
 
-from scipy.interpolate import interp1d
+from numpy import (
+    ndarray, nan_to_num, dtype, generic, ascontiguousarray, empty, exp, log, asarray,
+    allclose, clip, diff, floor, intp, searchsorted,
+)
+
+from scipy.interpolate import CubicSpline
 
 from csv import reader
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .units import angstrom, amu
 
 
@@ -77,19 +93,32 @@ ELEMENTS = (
 r"""Tuple of the symbols for each of the 118 elements. The zeroth element is a placeholder."""
 
 
-# The correct way to convert numpy arrays to bytes is different on Mac/"Darwin"
-if platform == "darwin":
-    # Mac
-    def _array_to_bytes(array):
-        r"""Convert a numpy.ndarray instance to bytes."""
-        return array.tobytes()
+_SYMBOL_TO_Z = {symbol: z for z, symbol in enumerate(ELEMENTS)}
+r"""Mapping from element symbol to element number."""
+
+
+_HCI_DATAFILE = "{lower}/raw/{z:03d}_q{charge:03d}_m{mult:02d}_k{nexc:02d}_sp_{dataset}{suffix}"
+r"""Template for the filename of an HCI raw data file, relative to the data path."""
+
+
+_SPIN_SUFFIX = {'a': 'up', 'b': 'dn', 'ab': 'tot', 'm': 'mag'}
+r"""Mapping from spin type to the suffix of the corresponding Species fields."""
+
+
+_NDARRAY_EXT = 1
+r"""MessagePack extension type code for `numpy.ndarray` objects."""
+
 
+_NDARRAY_HEADER = Struct("<8sQ")
+r"""Header of an encoded `numpy.ndarray`: the dtype string and the number of dimensions."""
 
-else:
-    # Linux and friends
-    def _array_to_bytes(array):
-        r"""Convert a numpy.ndarray instance to bytes."""
-        return array.data if array.flags["C_CONTIGUOUS"] else array.tobytes()
+
+_MAP32_HEADER = Struct(">BI")
+r"""MessagePack ``map 32`` header: the format byte and the number of entries."""
+
+
+_EXT32_HEADER = Struct(">BIb")
+r"""MessagePack ``ext 32`` header: the format byte, the payload size and the type code."""
 
 
 @dataclass(eq=False, order=False)
@@ -166,12 +195,37 @@ class Species(SpeciesData):
         SpeciesData.__init__(self, *args, **kwargs)
         #
         # Attributes declared here are not considered as part of the dataclasses interface,
-        # and therefore are not included in the output of dataclasses.asdict(species_instance)
+        # and therefore are not included in the output of Species.to_dict()
         #
         # Charge and multiplicity
         #
         self.charge = self.natom - self.nelec
         self.mult = self.nspin + 1
+        #
+        # Interpolated splines, built lazily and keyed by (kind, spin, log), each stored along
+        # with the grid and values it was built from
+        #
+        self._spline_cache = {}
+
+    def _get_spline(self, kind, spin, values, log):
+        r"""Return the cached spline of ``values``, building it on first use.
+
+        The spline is rebuilt if ``self.rs`` or ``values`` was reassigned since it was cached.
+        A ``ValueError`` is raised if ``log`` is set and ``values`` are not all positive.
+
+        """
+        key = (kind, spin, log)
+        cached = self._spline_cache.get(key)
+        if cached is not None and cached[0] is self.rs and cached[1] is values:
+            return cached[2]
+        if log and not (asarray(values) > 0).all():
+            raise ValueError(
+                f"Cannot build a log spline of `{kind}_{_SPIN_SUFFIX[spin]}` for `{spin}` spin: "
+                "values must be strictly positive"
+            )
+        spline = cubic_interp(self.rs, values, log=log)
+        self._spline_cache[key] = (self.rs, values, spline)
+        return spline
 
     #
     # Density splines
@@ -193,10 +247,10 @@ class Species(SpeciesData):
             Whether the logarithm of the density is used for interpolation, by default False
 
         """
-        spins = {'a': self.dens_up, 'b': self.dens_dn, 'ab': self.dens_tot, 'm': self.dens_mag}
+        values = getattr(self, f"dens_{_SPIN_SUFFIX[spin]}")
         if index is None:
-            if spins[spin] is not None:
-                spline = cubic_interp(self.rs, spins[spin], log=log)
+            if values is not None:
+                spline = self._get_spline("dens", spin, values, log)
             else:
                 raise ValueError(f'Density spline for occupied `{spin}` spin-orbitals unavailable')
         else:
@@ -220,10 +274,10 @@ class Species(SpeciesData):
             Whether the logarithm of the density is used for interpolation, by default False
 
         """
-        spins = {'a': self.d_dens_up, 'b': self.d_dens_dn, 'ab': self.d_dens_tot, 'm': self.d_dens_mag}
+        values = getattr(self, f"d_dens_{_SPIN_SUFFIX[spin]}")
         if index is None:
-            if spins[spin] is not None:
-                spline = cubic_interp(self.rs, spins[spin], log=log)
+            if values is not None:
+                spline = self._get_spline("d_dens", spin, values, log)
             else:
                 raise ValueError(f'Density derivative spline for occupied `{spin}` spin-orbitals unavailable.')
         else:
@@ -232,10 +286,10 @@ class Species(SpeciesData):
 
     def ked_spline(self, points, spin='ab', index=None, log=True):
         r"""Compute positive definite kinetic energy density."""
-        spins = {'a': self.ked_up, 'b': self.ked_dn, 'ab': self.ked_tot, 'm': self.ked_mag}
+        values = getattr(self, f"ked_{_SPIN_SUFFIX[spin]}")
         if index is None:
-            if spins[spin] is not None:
-                spline = cubic_interp(self.rs, spins[spin], log=log)
+            if values is not None:
+                spline = self._get_spline("ked", spin, values, log)
             else:
                 raise ValueError(f'Kinetic energy density for occupied `{spin}` spin-orbitals unavailable.')
         else:
@@ -244,30 +298,88 @@ class Species(SpeciesData):
 
     def lapl_spline(self, points, spin='ab', index=None, log=False):
         r"""Compute Laplacian of electron density."""
-        spins = {'a': self.lapl_up, 'b': self.lapl_dn, 'ab': self.lapl_tot, 'm': self.lapl_mag}
+        values = getattr(self, f"lapl_{_SPIN_SUFFIX[spin]}")
         if index is None:
-            if spins[spin] is not None:
-                spline = cubic_interp(self.rs, spins[spin], log=log)
+            if values is not None:
+                spline = self._get_spline("lapl", spin, values, log)
             else:
                 raise ValueError(f'Density laplacian for occupied `{spin}` spin-orbitals unavailable')
         else:
             raise NotImplementedError('Desnity laplacian for a subset of orbitals is not supported yet.')
         return spline(points)
 
+    def evaluate_all(self, points, spin='ab', log_map=None):
+        r"""Compute the density, its derivative, its Laplacian and the kinetic energy density.
+
+        The interval of the radial grid containing each point is found once and shared by the
+        splines of all four properties. On uniform grids with numba installed, each spline is
+        instead evaluated by the compiled kernel, which finds the intervals in constant time.
+
+        Parameters
+        ----------
+        points : ndarray, (N,)
+            Radial grid points given as a 1D-array.
+        spin : str, optional
+            Type of occupied spin orbitals which can be either "a" (for alpha), "b" (for
+            beta), and "ab" (for alpha + beta), by default 'ab'
+        log_map : dict, optional
+            Whether the logarithm of each property ("dens", "d_dens", "lapl" or "ked") is used
+            for interpolation. Properties not given use the defaults of the corresponding
+            ``*_spline`` methods, by default None
+
+        Returns
+        -------
+        dict
+            The properties evaluated at the points, keyed by "dens", "d_dens", "lapl" and "ked".
+            Properties unavailable for the given spin are set to ``None``.
+
+        """
+        logs = {'dens': False, 'd_dens': False, 'lapl': False, 'ked': True}
+        if log_map is not None:
+            logs.update(log_map)
+        suffix = _SPIN_SUFFIX[spin]
+        points = asarray(points, dtype=float)
+        k = t = None
+        result = {}
+        for kind, use_log in logs.items():
+            values = getattr(self, f"{kind}_{suffix}")
+            if values is None:
+                result[kind] = None
+                continue
+            spline = self._get_spline(kind, spin, values, use_log)
+            if isinstance(spline, UniformCubicSpline) and _cubic_kernel() is not None:
+                # The single-pass kernel beats gathering the coefficients with shared intervals
+                result[kind] = spline(points)
+                continue
+            if k is None:
+                # All splines share the radial grid, so the intervals are computed only once
+                if isinstance(spline, UniformCubicSpline):
+                    k = spline.interval(points)
+                else:
+                    k = clip(searchsorted(self.rs, points, side="right") - 1, 0, len(self.rs) - 2)
+                t = points - self.rs[k]
+            y = asarray(_horner(spline.c, k, t))
+            result[kind] = exp(y, out=y) if use_log else y
+        return result
+
     def to_dict(self):
-        r"""Return the dictionary representation of the Species instance."""
-        return asdict(self)
+        r"""Return a read-only dictionary view of the Species instance.
 
-    def to_json(self):
-        r"""Return the JSON string representation of the Species instance."""
-        return dumps(asdict(self), cls=Species._JSONEncoder)
+        No values are copied: arrays and dictionaries are those of the Species instance, and
+        should not be modified.
+
+        """
+        return MappingProxyType(self._shallow_dict())
 
-    class _JSONEncoder(JSONEncoder):
-        r"""JSON encoder handling simple `numpy.ndarray` objects (for `Species.dump`)."""
+    def _shallow_dict(self):
+        r"""Return a dictionary of the dataclass fields, without copying their values."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
-        def default(self, obj):
-            r"""Default encode function."""
-            return obj.tolist() if isinstance(obj, ndarray) else JSONEncoder.default(self, obj)
+    def to_json(self):
+        r"""Return the JSON string representation of the Species instance."""
+        if orjson is None:
+            return dumps(self._shallow_dict(), default=_json_default)
+        return orjson.dumps(self._shallow_dict(), default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
 
     @staticmethod
     def _msgfile(elem, charge, mult, nexc, dataset, datapath):
@@ -278,20 +390,20 @@ class Species(SpeciesData):
         r"""Dump the Species instance to a MessagePack file in the database."""
         # Get database entry filename
         fn = Species._msgfile(self.elem, self.charge, self.mult, self.nexc, self.dataset, datapath)
-        # Convert numpy arrays to raw bytes for dumping as msgpack
-        msg = {k: _array_to_bytes(v) if isinstance(v, ndarray) else v for k, v in asdict(self).items()}
-        # Dump msgpack entry to database
+        makedirs(dirname(fn), exist_ok=True)
+        # Dump msgpack entry to database; numpy arrays are encoded as extension types
         with open(fn, "wb") as f:
-            f.write(pack_msg(msg))
+            dump_msg(self._shallow_dict(), f)
 
 
 def load(elem, charge, mult, nexc=0, dataset=DEFAULT_DATASET, datapath=DEFAULT_DATAPATH):
     r"""Load an atomic or ionic species from the AtomDB database."""
-    # Load database msgpack entry
+    # Memory-map the database msgpack entry; the mapping stays valid after the file is closed
     with open(Species._msgfile(elem, charge, mult, nexc, dataset, datapath), "rb") as f:
-        msg = unpack_msg(f)
-    # Convert raw bytes back to numpy arrays, initialize the Species instance, return it
-    return Species(**{k: frombuffer(v) if isinstance(v, bytes) else v for k, v in msg.items()})
+        mm = mmap(f.fileno(), 0, access=ACCESS_READ)
+    # Decode the entry; numpy arrays are views into the mapped file, so no data is copied, and
+    # they keep the mapping alive through their buffers
+    return Species(**_MSGPACK_DECODER.decode(mm))
 
 
 def compile(elem, charge, mult, nexc=0, dataset=DEFAULT_DATASET, datapath=DEFAULT_DATAPATH):
@@ -310,17 +422,29 @@ def datafile(suffix, elem, charge, mult, nexc=0, dataset=None, datapath=DEFAULT_
     # Check that all non-optional arguments are specified
     if dataset is None:
         raise ValueError("Argument `dataset` cannot be unspecified")
+    if dataset.split('_')[0] != 'hci':
+        raise ValueError(f"Raw data files of dataset `{dataset}` are not supported")
     # Format the filename specified and return it
-    suffix = f"{'' if suffix.startswith('.') else '_'}{suffix.lower()}"
-    if dataset.split('_')[0] == 'hci':
-        prefix = f"{str(element_number(elem)).zfill(3)}"
-        tag = f"q{str(charge).zfill(3)}_m{mult:02d}_k{nexc:02}_sp_{dataset}"
-    return join(datapath, f"{dataset.lower()}/raw/{prefix}_{tag}{suffix}")
+    return join(datapath, _HCI_DATAFILE.format(
+        lower=dataset.lower(),
+        dataset=dataset,
+        z=_SYMBOL_TO_Z[elem] if isinstance(elem, str) else elem,
+        charge=charge,
+        mult=mult,
+        nexc=nexc,
+        suffix=_datafile_suffix(suffix),
+    ))
+
+
+@lru_cache(maxsize=None)
+def _datafile_suffix(suffix):
+    r"""Normalize the suffix of a raw data file name."""
+    return suffix.lower() if suffix.startswith('.') else f"_{suffix.lower()}"
 
 
 def element_number(elem):
     r"""Return the element number from the given element symbol."""
-    return ELEMENTS.index(elem) if isinstance(elem, str) else elem
+    return _SYMBOL_TO_Z[elem] if isinstance(elem, str) else elem
 
 
 def element_symbol(elem):
@@ -328,32 +452,241 @@ def element_symbol(elem):
     return elem if isinstance(elem, str) else ELEMENTS[elem]
 
 
+def _json_default(obj):
+    r"""Convert objects not handled by the JSON encoder (for `Species.to_json`)."""
+    if isinstance(obj, (ndarray, generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type `{type(obj).__name__}` is not JSON serializable")
+
+
+def _encode_ndarray(obj):
+    r"""Encode a numpy.ndarray instance as a MessagePack extension type.
+
+    The payload is the dtype string and shape of the array, optionally followed by zero bytes
+    of alignment padding, and then by the raw contents of the array buffer. Numpy scalars are
+    encoded as the equivalent Python scalars.
+
+    """
+    if isinstance(obj, generic):
+        return obj.item()
+    if not isinstance(obj, ndarray):
+        raise TypeError(f"Cannot serialize object of type `{type(obj).__name__}`")
+    return Ext(_NDARRAY_EXT, _ndarray_header(obj) + _array_to_buffer(obj))
+
+
+def _array_to_buffer(array):
+    r"""Return a flat byte memoryview of a numpy.ndarray, copying only if it is not C-contiguous."""
+    return memoryview(ascontiguousarray(array).reshape(-1).view("u1"))
+
+
+def _ndarray_header(array):
+    r"""Return the extension type header of a numpy.ndarray instance."""
+    typestr = _check_dtype(array.dtype).str.encode()
+    # The header stores at most 8 bytes of dtype string, longer ones would be truncated
+    if len(typestr) > 8:
+        raise TypeError(f"Cannot serialize array of dtype `{array.dtype.str}`: dtype string too long")
+    return _NDARRAY_HEADER.pack(typestr, array.ndim) + _shape_struct(array.ndim).pack(*array.shape)
+
+
+def _check_dtype(dt):
+    r"""Return the dtype if arrays of it can be (de)serialized as raw buffers, else raise TypeError.
+
+    Object and structured dtypes are refused, since their buffers hold (or may hold) pointers
+    to Python objects, which are meaningless, and unsafe to dereference, once read from a file.
+
+    """
+    if dt.hasobject or dt.fields is not None:
+        raise TypeError(f"Arrays of dtype `{dt.str}` cannot be (de)serialized")
+    return dt
+
+
+@lru_cache(maxsize=None)
+def _shape_struct(ndim):
+    r"""Return the Struct packing the shape of an encoded array with ``ndim`` dimensions."""
+    return Struct(f"<{ndim}q")
+
+
+def _decode_ndarray(code, data):
+    r"""Decode a MessagePack extension type into a numpy.ndarray instance without copying."""
+    if code != _NDARRAY_EXT:
+        return Ext(code, bytes(data))
+    typestr, ndim = _NDARRAY_HEADER.unpack_from(data)
+    shape = _shape_struct(ndim).unpack_from(data, _NDARRAY_HEADER.size)
+    dt = _check_dtype(dtype(typestr.rstrip(b"\0").decode()))
+    # The array buffer is at the end of the payload, after any alignment padding
+    offset = len(data) - dt.itemsize * prod(shape)
+    if offset < _NDARRAY_HEADER.size + 8 * ndim:
+        raise ValueError("Encoded array payload is too short for its dtype and shape")
+    return ndarray(shape, dt, buffer=data, offset=offset)
+
+
+_MSGPACK_ENCODER = Encoder(enc_hook=_encode_ndarray)
+r"""Reusable MessagePack encoder handling `numpy.ndarray` objects."""
+
+
+_MSGPACK_DECODER = Decoder(ext_hook=_decode_ndarray)
+r"""Reusable MessagePack decoder handling `numpy.ndarray` objects."""
+
+
 def pack_msg(msg):
     r"""Pack an object to MessagePack binary format."""
-    return Packer(use_bin_type=True).pack(msg)
+    return _MSGPACK_ENCODER.encode(msg)
+
+
+def dump_msg(msg, f):
+    r"""Pack a dictionary to MessagePack binary format and write it to a file.
+
+    The buffers of numpy arrays are written to the file directly, so the packed message is
+    never assembled in memory.
+
+    """
+    buf = bytearray(_MAP32_HEADER.pack(0xDF, len(msg)))
+    pos = 0
+    for key, value in msg.items():
+        _MSGPACK_ENCODER.encode_into(key, buf, -1)
+        if isinstance(value, ndarray):
+            header = _ndarray_header(value)
+            # Pad the header so that the array is aligned in the file, and thus in memory when
+            # the file is memory-mapped by `load`
+            end = pos + len(buf) + _EXT32_HEADER.size + len(header)
+            header += bytes(-end % value.dtype.alignment)
+            # Write the pending fields and extension type headers, then the array buffer itself
+            buf += _EXT32_HEADER.pack(0xC9, len(header) + value.nbytes, _NDARRAY_EXT)
+            buf += header
+            f.write(buf)
+            pos += len(buf) + value.nbytes
+            f.write(_array_to_buffer(value))
+            buf.clear()
+        else:
+            _MSGPACK_ENCODER.encode_into(value, buf, -1)
+    f.write(buf)
 
 
 def unpack_msg(msg):
     r"""Unpack an object from MessagePack binary format."""
-    return Unpacker(msg, use_list=False, strict_map_key=True).unpack()
+    return _MSGPACK_DECODER.decode(msg.read())
 
 
-class interp1d_log(interp1d):
-    r"""Interpolate over a 1-D grid."""
+class LogCubicSpline(CubicSpline):
+    r"""Cubic spline interpolating the logarithm of the data over a 1-D grid."""
 
     def __init__(self, x, y, **kwargs):
-        r"""Initialize the interp1d_log instance."""
-        interp1d.__init__(self, x, log(y), **kwargs)
+        r"""Initialize the LogCubicSpline instance."""
+        CubicSpline.__init__(self, x, log(y), **kwargs)
+
+    def __call__(self, x):
+        r"""Compute the interpolation at some x-values."""
+        y = CubicSpline.__call__(self, x)
+        return exp(y, out=y)
+
+
+class UniformCubicSpline:
+    r"""Cubic spline over a uniformly spaced 1-D grid.
+
+    The piecewise-polynomial coefficients are computed once, and the interval containing
+    each query point is found in constant time as ``k = floor((x - x_0) / dx)`` instead of
+    by a binary search over the knots. Points outside of the grid are extrapolated from the
+    first or last interval.
+
+    """
+
+    _log = False
+    r"""Whether the spline interpolates the logarithm of the data."""
+
+    def __init__(self, x, y):
+        r"""Initialize the UniformCubicSpline instance."""
+        spline = CubicSpline(x, y, bc_type="not-a-knot", extrapolate=True)
+        self.x = spline.x
+        self.c = spline.c
+        self.x0 = self.x[0]
+        self.inv_dx = (len(self.x) - 1) / (self.x[-1] - self.x[0])
 
     def __call__(self, x):
         r"""Compute the interpolation at some x-values."""
-        return exp(interp1d.__call__(self, x))
+        x = asarray(x, dtype=float)
+        kernel = _cubic_kernel()
+        if kernel is not None:
+            # The output is C-ordered, so that the kernel writes into the returned array through
+            # its flattened view; the points are flattened from a C-ordered copy if needed
+            out = empty(x.shape)
+            kernel(ascontiguousarray(x).reshape(-1), self.x0, self.inv_dx, self.x, self.c, self._log, out.reshape(-1))
+            return out
+        k = self.interval(x)
+        y = asarray(_horner(self.c, k, x - self.x[k]))
+        return exp(y, out=y) if self._log else y
+
+    def interval(self, x):
+        r"""Return the index of the grid interval containing each x-value.
+
+        NaN x-values are assigned to the first interval, so that they evaluate to NaN.
+
+        """
+        k = clip(floor((x - self.x0) * self.inv_dx), 0, len(self.x) - 2)
+        return nan_to_num(k, nan=0).astype(intp)
+
+
+class LogUniformCubicSpline(UniformCubicSpline):
+    r"""Cubic spline interpolating the logarithm of the data over a uniform 1-D grid."""
+
+    _log = True
+
+    def __init__(self, x, y):
+        r"""Initialize the LogUniformCubicSpline instance."""
+        UniformCubicSpline.__init__(self, x, log(y))
+
+
+def _horner(c, k, t):
+    r"""Evaluate the cubic polynomials ``c[:, k]`` at offsets ``t`` from their breakpoints."""
+    return ((c[0, k] * t + c[1, k]) * t + c[2, k]) * t + c[3, k]
+
+
+def _eval_cubic(x, x0, inv_dx, xs, c, log, out):
+    r"""Evaluate a cubic spline on a uniform grid at each x-value, in a single pass.
+
+    If ``log`` is true, the spline interpolates the logarithm of the data and the result is
+    exponentiated before it is stored. This is the kernel compiled by `_cubic_kernel`.
+
+    """
+    kmax = c.shape[1] - 1
+    for i in range(x.shape[0]):
+        u = floor((x[i] - x0) * inv_dx)
+        # Clamp before converting to int; NaN fails both tests and goes to the first interval
+        if u >= kmax:
+            k = kmax
+        elif u >= 0:
+            k = int(u)
+        else:
+            k = 0
+        t = x[i] - xs[k]
+        y = ((c[0, k] * t + c[1, k]) * t + c[2, k]) * t + c[3, k]
+        out[i] = exp(y) if log else y
+
+
+@lru_cache(maxsize=None)
+def _cubic_kernel():
+    r"""Return the Numba-compiled `_eval_cubic`, or ``None`` if numba is not installed.
+
+    numba is imported here, on the first evaluation of a spline, rather than on import of
+    AtomDB, since importing it is slow.
+
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    # Fast-math flags without "nnan" and "ninf", so that NaN and infinite x-values are handled
+    return njit(cache=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"})(_eval_cubic)
 
 
 def cubic_interp(x, y, log=False):
     r"""Create an interpolated cubic spline for the given data."""
-    cls = interp1d_log if log else interp1d
-    return cls(x, y, kind="cubic", copy=False, fill_value="extrapolate", assume_sorted=True)
+    dx = diff(x)
+    # Compare the steps relative to each other only, so that the check holds at any scale
+    if allclose(dx, dx[0], rtol=1e-10, atol=0):
+        cls = LogUniformCubicSpline if log else UniformCubicSpline
+        return cls(x, y)
+    cls = LogCubicSpline if log else CubicSpline
+    return cls(x, y, bc_type="not-a-knot", extrapolate=True)
 
 
 def get_element_data(elem):
@@ -405,7 +738,13 @@ def get_element_data(elem):
         http://dx.doi.org/10.1016/s0166-1280(09)80008-0
     """
 
-    z = element_number(elem)
+    cov_radii, vdw_radii, mass = _element_table()[element_number(elem)]
+    return dict(cov_radii), dict(vdw_radii), mass
+
+
+@lru_cache(maxsize=None)
+def _element_table():
+    r"""Parse elements.csv once into a tuple of ``(cov_radii, vdw_radii, mass)`` indexed by Z."""
     convertor_types = {
         'int': (lambda s: int(s)),
         'float': (lambda s : float(s)),
@@ -428,15 +767,18 @@ def get_element_data(elem):
         convertors = [convertor_types[unit] for unit in next(rows)]
         data = list(rows)
 
+    # Entry zero is a placeholder, as in ELEMENTS
+    table = [None] * len(ELEMENTS)
+    for row in data:
         cov_radii = {}
         vdw_radii = {}
-        for idx, (name, val) in enumerate(zip(names, data[z])):
+        mass = None
+        for name, convertor, val in zip(names, convertors, row):
             if 'cov_radius' in name:
-                kval = name.split("_")[-1]
-                cov_radii[kval] = convertors[idx](val) if val is not "" else None
+                cov_radii[name.split("_")[-1]] = convertor(val) if val != "" else None
             elif 'vdw_radius' in name:
-                kval = name.split("_")[-1]
-                vdw_radii[kval] = convertors[idx](val) if val is not "" else None
+                vdw_radii[name.split("_")[-1]] = convertor(val) if val != "" else None
             elif name == 'mass':
-                mass = convertors[idx](val)
-    return cov_radii, vdw_radii, mass
+                mass = convertor(val) if val != "" else None
+        table[int(row[0])] = (cov_radii, vdw_radii, mass)
+    return tuple(table)
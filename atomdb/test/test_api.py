@@ -0,0 +1,219 @@
+# This file is part of AtomDB.
+#
+# AtomDB is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# AtomDB is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with AtomDB. If not, see <http://www.gnu.org/licenses/>.
+
+
+import copy
+
+import io
+
+import json
+
+import pickle
+
+import shutil
+
+import numpy as np
+
+import pytest
+from numpy.testing import assert_almost_equal, assert_raises
+
+import atomdb
+
+
+def make_species():
+    """Build a small Species instance with analytic radial data."""
+    rs = np.linspace(0.01, 1.0, 100)
+    dens = np.exp(-2.0 * rs) / np.pi
+    return atomdb.Species(
+        "test", "H", 1, None, 1, 1, 0, {}, {}, 1.0,
+        rs=rs,
+        dens_tot=dens,
+        d_dens_tot=-2.0 * dens,
+        ked_tot=0.5 * dens,
+    )
+
+
+def test_dens_spline():
+    species = make_species()
+    points = np.linspace(0.05, 0.95, 37)
+    expected = np.exp(-2.0 * points) / np.pi
+    assert_almost_equal(species.dens_spline(points), expected, decimal=6)
+    assert_almost_equal(species.dens_spline(points, log=True), expected, decimal=6)
+    assert_almost_equal(species.d_dens_spline(points), -2.0 * expected, decimal=6)
+    assert_almost_equal(species.ked_spline(points), 0.5 * expected, decimal=6)
+
+
+def test_spline_cache():
+    species = make_species()
+    points = np.linspace(0.05, 0.95, 11)
+    species.dens_spline(points)
+    species.dens_spline(2 * points)
+    species.dens_spline(points, log=True)
+    assert len(species._spline_cache) == 2
+    assert "_spline_cache" not in species.to_dict()
+    # Reassigning a field or the grid invalidates the cached spline
+    expected = species.dens_spline(points)
+    species.dens_tot = 2.0 * species.dens_tot
+    assert_almost_equal(species.dens_spline(points), 2.0 * expected)
+    species.rs = species.rs + 0.1
+    assert_almost_equal(species.dens_spline(points + 0.1), 2.0 * expected)
+
+
+def test_spline_unavailable():
+    species = make_species()
+    assert_raises(ValueError, species.lapl_spline, np.array([0.5]))
+    assert_raises(ValueError, species.dens_spline, np.array([0.5]), spin="a")
+    # Log splines need strictly positive data
+    species.dens_mag = np.zeros_like(species.rs)
+    assert_almost_equal(species.dens_spline(np.array([0.5]), spin="m"), [0.0])
+    with pytest.raises(ValueError, match="dens_mag"):
+        species.dens_spline(np.array([0.5]), spin="m", log=True)
+    with pytest.raises(ValueError, match="dens_mag"):
+        species.evaluate_all(np.array([0.5]), spin="m", log_map={"dens": True})
+
+
+@pytest.mark.parametrize("kernel", [atomdb.api._cubic_kernel, lambda: None], ids=["numba", "numpy"])
+def test_uniform_cubic_spline(kernel, monkeypatch):
+    monkeypatch.setattr(atomdb.api, "_cubic_kernel", kernel)
+    x = np.linspace(0.01, 1.0, 50)
+    y = np.exp(-3.0 * x)
+    points = np.linspace(-0.1, 1.1, 101)
+    spline = atomdb.api.cubic_interp(x, y)
+    assert isinstance(spline, atomdb.api.UniformCubicSpline)
+    expected = atomdb.api.CubicSpline(x, y)(points)
+    assert_almost_equal(spline(points), expected, decimal=10)
+    spline = atomdb.api.cubic_interp(x, y, log=True)
+    assert_almost_equal(spline(points), np.exp(-3.0 * points), decimal=10)
+    # Points in Fortran order, or otherwise non-contiguous, give the same results
+    points = np.linspace(0.0, 1.0, 12).reshape(3, 4).T
+    assert_almost_equal(spline(points), np.exp(-3.0 * points), decimal=10)
+    assert_almost_equal(spline(points[::2]), np.exp(-3.0 * points[::2]), decimal=10)
+    # Scalar points give 0-d results
+    assert spline(0.5).shape == ()
+    assert_almost_equal(spline(0.5), np.exp(-1.5), decimal=10)
+    # NaN points evaluate to NaN
+    assert np.isnan(spline(np.array([0.5, np.nan]))).tolist() == [False, True]
+    # Non-uniform grids fall back to the general cubic spline
+    x = np.geomspace(0.01, 1.0, 50)
+    assert not isinstance(atomdb.api.cubic_interp(x, x), atomdb.api.UniformCubicSpline)
+    # ... also at small scales
+    x = np.geomspace(1e-9, 1e-7, 50)
+    y = np.sin(3e7 * x)
+    spline = atomdb.api.cubic_interp(x, y)
+    assert not isinstance(spline, atomdb.api.UniformCubicSpline)
+    assert_almost_equal(spline(x), y, decimal=10)
+    assert isinstance(atomdb.api.cubic_interp(np.linspace(0.0, 1e-9, 50), x), atomdb.api.UniformCubicSpline)
+
+
+def test_dump_load(tmp_path):
+    species = make_species()
+    species.mo_energies = np.array([[-0.5, 0.1], [0.2, 0.3]])
+    species.mo_occs = np.array([1, 0], dtype=np.int32)
+    species._dump(str(tmp_path))
+    # The database directory is created again if it was removed
+    shutil.rmtree(tmp_path / "test")
+    species._dump(str(tmp_path))
+    loaded = atomdb.load("H", 0, 2, dataset="test", datapath=str(tmp_path))
+    assert loaded.mo_energies.shape == (2, 2)
+    assert loaded.mo_occs.dtype == np.int32
+    assert_almost_equal(loaded.mo_energies, species.mo_energies)
+    assert_almost_equal(loaded.dens_tot, species.dens_tot)
+    assert loaded.dens_up is None
+    assert loaded.cov_radii == species.cov_radii
+    # Arrays are aligned views into the memory-mapped file
+    assert loaded.dens_tot.flags.aligned
+    assert not loaded.dens_tot.flags.writeable
+    # Loaded species can be pickled and copied
+    loaded.dens_spline(np.array([0.5]))
+    for copied in (pickle.loads(pickle.dumps(loaded)), copy.deepcopy(loaded)):
+        assert_almost_equal(copied.dens_tot, species.dens_tot)
+        assert_almost_equal(copied.dens_spline(np.array([0.5])), loaded.dens_spline(np.array([0.5])))
+
+
+def test_pack_msg_arrays():
+    msg = {
+        "empty": np.zeros((0, 3)),
+        "scalar": np.array(2.5),
+        "fortran": np.asfortranarray(np.arange(6.0).reshape(2, 3)),
+        "datetime": np.array(["2020-01-01", "2021-06-30"], dtype="datetime64[D]"),
+    }
+    f = io.BytesIO()
+    atomdb.api.dump_msg(msg, f)
+    for data in (atomdb.api.pack_msg(msg), f.getvalue()):
+        decoded = atomdb.api.unpack_msg(io.BytesIO(data))
+        for key, array in msg.items():
+            assert decoded[key].dtype == array.dtype
+            assert decoded[key].shape == array.shape
+            assert (decoded[key] == array).all()
+
+
+def test_pack_msg_unsafe_dtypes():
+    for array in (
+        np.array(["x" * 50, 3.5], dtype=object),
+        np.zeros(2, dtype=[("a", "f8"), ("b", "i4")]),
+        np.zeros(0, dtype="<U123456789"),
+    ):
+        assert_raises(TypeError, atomdb.api.pack_msg, {"a": array})
+        assert_raises(TypeError, atomdb.api.dump_msg, {"a": array}, io.BytesIO())
+
+
+def test_unpack_msg_unsafe_dtypes():
+    header = atomdb.api._NDARRAY_HEADER.pack(b"|O", 1) + atomdb.api._shape_struct(1).pack(1)
+    msg = atomdb.api.pack_msg({"a": atomdb.api.Ext(atomdb.api._NDARRAY_EXT, header + bytes(8))})
+    assert_raises(TypeError, atomdb.api.unpack_msg, io.BytesIO(msg))
+
+
+def test_get_element_data():
+    cov_radii, vdw_radii, mass = atomdb.get_element_data("H")
+    assert_almost_equal(mass, 1.007975 * atomdb.amu)
+    assert_almost_equal(cov_radii["cordero"], 0.31 * atomdb.angstrom)
+    assert cov_radii["bragg"] is None
+    assert atomdb.get_element_data(1) == atomdb.get_element_data("H")
+    # Returned dictionaries are not shared with the cached table
+    cov_radii["cordero"] = None
+    assert atomdb.get_element_data("H")[0]["cordero"] is not None
+
+
+@pytest.mark.parametrize("kernel", [atomdb.api._cubic_kernel, lambda: None], ids=["numba", "numpy"])
+def test_evaluate_all(kernel, monkeypatch):
+    monkeypatch.setattr(atomdb.api, "_cubic_kernel", kernel)
+    species = make_species()
+    points = np.linspace(-0.1, 1.1, 41)
+    result = species.evaluate_all(points, log_map={"dens": True})
+    assert_almost_equal(result["dens"], species.dens_spline(points, log=True))
+    assert_almost_equal(result["d_dens"], species.d_dens_spline(points))
+    assert_almost_equal(result["ked"], species.ked_spline(points))
+    assert result["lapl"] is None
+    result = species.evaluate_all(np.array([0.5, np.nan]))
+    assert np.isnan(result["dens"]).tolist() == [False, True]
+
+
+def test_to_json():
+    species = make_species()
+    species.energy = np.float64(-0.5)
+    data = json.loads(species.to_json())
+    assert data["elem"] == "H"
+    assert data["energy"] == -0.5
+    assert data["dens_up"] is None
+    assert_almost_equal(data["dens_tot"], species.dens_tot)
+
+
+def test_to_dict():
+    species = make_species()
+    data = species.to_dict()
+    assert data["elem"] == "H"
+    assert data["dens_tot"] is species.dens_tot
+    with assert_raises(TypeError):
+        data["elem"] = "He"